@@ -1,21 +1,71 @@
-import calendar as pycal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Dict, List
+from functools import lru_cache
+from html import escape
+from typing import Dict, Final, List, Tuple
+import re
 
+import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from hkex_client import (
     build_event_index,
+    clear_caches,
     convert_to_usd,
     fetch_ipo_calendar,
     fetch_ipo_details,
     format_money,
 )
 
+DETAILS_MAX_WORKERS = 8
+DETAILS_ITEM_FIELDS = (
+    "company",
+    "stock_code",
+    "prospectus_date",
+    "listing_date",
+    "announcement_url",
+    "prospectus_url",
+    "allotment_url",
+    "funds_raised_hkd",
+    "subscription_price_hkd",
+    "offer_price_text",
+)
+DETAILS_DOCUMENT_FIELDS = ("title", "url", "published_date", "source")
+NO_LISTING_DATE_COLUMNS = ["Company", "First posting", "Category", "Board", "Status"]
+_convert_to_usd = lru_cache(maxsize=1024)(convert_to_usd)
+_AMOUNT_SCALES = ((1_000_000_000, "B"), (1_000_000, "M"))
 CALENDAR_DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
-CALENDAR_CSS = """
+CALENDAR_CSS: Final[str] = """
 <style>
+.calendar-grid {
+  display: grid;
+  grid-template-columns: repeat(7, 1fr);
+  gap: 4px;
+  margin-bottom: 0.75rem;
+}
+.calendar-cell {
+  min-height: 4.5rem;
+  padding: 0.2rem;
+  border: 1px solid #eee;
+  border-radius: 4px;
+}
+.calendar-cell.selected { border-color: #1f77b4; }
+.day-btn {
+  display: inline-block;
+  min-width: 1.8rem;
+  padding: 0.1rem 0.4rem;
+  border: 1px solid #ddd;
+  border-radius: 6px;
+  font-weight: 600;
+  font-size: 0.85rem;
+  text-align: center;
+  text-decoration: none;
+  color: inherit;
+  background: #fff;
+}
+.day-btn:hover { border-color: #1f77b4; color: #1f77b4; }
 .calendar-header {
   font-weight: 600;
   text-align: center;
@@ -51,6 +101,12 @@ CALENDAR_CSS = """
 .legend.trade { border: 1px solid #2ca02c; }
 </style>
 """
+CALENDAR_CSS_MIN: Final[str] = re.sub(r"\s*([{};:,])\s*", r"\1", re.sub(r"\s+", " ", CALENDAR_CSS)).strip()
+LEGEND_HTML: Final[str] = (
+    "<span class='legend bookbuilding'>Prospectus/Bookbuilding</span>"
+    "<span class='legend application'>Application proof</span>"
+    "<span class='legend trade'>Listing/Trade</span>"
+)
 
 
 @st.cache_data(ttl=1800)
@@ -59,89 +115,100 @@ def load_calendar(use_live: bool):
 
 
 @st.cache_data(ttl=1800)
-def load_details(item: Dict) -> Dict:
+def load_event_index(use_live: bool) -> Dict[date, List[Dict]]:
+    items, _ = load_calendar(use_live)
+    events = build_event_index(items)
+    for day_events in events.values():
+        for event in day_events:
+            event["html"] = event_html(event)
+    return events
+
+
+def event_html(event: Dict) -> str:
+    label = escape(truncate_text(event["item"].get("company", "")))
+    return f"<div class='event {event['type']}'>{escape(event['label'])}: {label}</div>"
+
+
+def details_key(item: Dict) -> Tuple:
+    documents = tuple(
+        tuple(document.get(field) for field in DETAILS_DOCUMENT_FIELDS)
+        for document in item.get("application_documents") or []
+    )
+    return tuple(item.get(field) for field in DETAILS_ITEM_FIELDS) + (documents,)
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def load_details(key: Tuple) -> Dict:
+    *values, documents = key
+    item = dict(zip(DETAILS_ITEM_FIELDS, values))
+    item["application_documents"] = [
+        dict(zip(DETAILS_DOCUMENT_FIELDS, document)) for document in documents
+    ]
     return fetch_ipo_details(item)
 
 
+@st.cache_data(ttl=None)
+def _month_grid(year: int, month: int) -> List[Tuple[date, bool]]:
+    first = date(year, month, 1)
+    start = first.toordinal() - first.weekday()
+    days = [date.fromordinal(ordinal) for ordinal in range(start, start + 42)]
+    return [(day, day.month == month) for day in days]
+
+
+@lru_cache(maxsize=2048)
 def truncate_text(value: str, max_len: int = 16) -> str:
     if len(value) <= max_len:
         return value
     return value[: max_len - 3] + "..."
 
 
-def render_calendar(year: int, month: int, events: Dict[date, List[Dict]]):
-    st.markdown(CALENDAR_CSS, unsafe_allow_html=True)
-    header_cols = st.columns(7)
-    for idx, day_name in enumerate(CALENDAR_DAYS):
-        header_cols[idx].markdown(f"<div class='calendar-header'>{day_name}</div>", unsafe_allow_html=True)
-
-    calendar = pycal.Calendar(firstweekday=0)
-    for week in calendar.monthdatescalendar(year, month):
-        cols = st.columns(7)
-        for idx, day in enumerate(week):
-            with cols[idx]:
-                if day.month != month:
-                    st.markdown("<div class='out-of-month'>&nbsp;</div>", unsafe_allow_html=True)
-                    continue
-                if st.button(str(day.day), key=f"day-{day.isoformat()}"):
-                    st.session_state["selected_date"] = day
-                for event in events.get(day, []):
-                    label = truncate_text(event["item"].get("company", ""))
-                    st.markdown(
-                        f"<div class='event {event['type']}'>{event['label']}: {label}</div>",
-                        unsafe_allow_html=True,
-                    )
+def render_calendar(
+    year: int,
+    month: int,
+    events: Dict[date, List[Dict]],
+    selected: date,
+    link_query: str = "",
+):
+    parts = ["<div class='calendar-grid'>"]
+    for day_name in CALENDAR_DAYS:
+        parts.append(f"<div class='calendar-header'>{day_name}</div>")
+    for day, in_month in _month_grid(year, month):
+        if not in_month:
+            parts.append("<div class='out-of-month'>&nbsp;</div>")
+            continue
+        cell_class = "calendar-cell selected" if day == selected else "calendar-cell"
+        parts.append(
+            f"<div class='{cell_class}'>"
+            f"<a class='day-btn' href='?d={day.isoformat()}{link_query}' target='_self'>{day.day}</a>"
+        )
+        parts.extend(event["html"] for event in events.get(day, []))
+        parts.append("</div>")
+    parts.append("</div>")
+    st.markdown("".join(parts), unsafe_allow_html=True)
+
 
+def _selected_date_from_query() -> date | None:
+    value = st.query_params.get("d")
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
 
-def format_date(value: date) -> str:
-    return value.strftime("%Y-%m-%d") if value else "N/A"
 
+def _query_flag(name: str) -> bool:
+    return st.query_params.get(name) != "0"
 
-def build_terms_table(item: Dict, details: Dict | None = None) -> Dict:
-    details = details or {}
-    bookbuilding_label = item.get("bookbuilding_label", "Bookbuilding")
-    trade_label = item.get("trade_label", "Trade date")
-    terms = {
-        "Stock code": item.get("stock_code") or "N/A",
-        bookbuilding_label: _format_range(
-            item.get("bookbuilding_start"), item.get("bookbuilding_end")
-        ),
-        trade_label: format_date(item.get("trade_date")),
-    }
-    if item.get("industry"):
-        terms["Industry"] = item.get("industry")
-    funds_raised_hkd = item.get("funds_raised_hkd")
-    if funds_raised_hkd:
-        terms["Funds raised (HKD)"] = format_hkd(funds_raised_hkd)
-    subscription_price_hkd = item.get("subscription_price_hkd")
-    if subscription_price_hkd:
-        terms["IPO price (HKD)"] = format_hkd(subscription_price_hkd, is_price=True)
-    offer_price_text = item.get("offer_price_text")
-    if offer_price_text and not subscription_price_hkd:
-        terms["IPO price (HKD)"] = offer_price_text
-    offer_price = details.get("offer_price")
-    if offer_price and not subscription_price_hkd and not offer_price_text:
-        terms["IPO price"] = format_currency_amount(offer_price)
-    lot_size = item.get("lot_size")
-    if lot_size:
-        terms["Lot size"] = lot_size
-    entry_fee_text = item.get("entry_fee_text")
-    if entry_fee_text:
-        terms["Entry fee (HKD)"] = entry_fee_text
-    if item.get("application_board"):
-        terms["Application board"] = item.get("application_board")
-    if item.get("application_status"):
-        terms["Application status"] = item.get("application_status")
-    shares_issued = details.get("shares_issued")
-    if shares_issued:
-        terms["Shares issued"] = format_shares(shares_issued)
-    market_cap = details.get("market_cap")
-    if market_cap:
-        terms["Market cap"] = format_currency_amount(market_cap)
-    valuation_multiple = details.get("valuation_multiple")
-    if valuation_multiple:
-        terms["Valuation multiple"] = valuation_multiple
-    return terms
+
+def _toggle_query(use_live: bool, enable_filings: bool) -> str:
+    flags = (("live", use_live), ("filings", enable_filings))
+    return "".join(f"&amp;{name}=0" for name, enabled in flags if not enabled)
+
+
+@lru_cache(maxsize=2048)
+def format_date(value: date) -> str:
+    return value.isoformat() if value else "N/A"
 
 
 def _format_range(start: date, end: date) -> str:
@@ -152,18 +219,19 @@ def _format_range(start: date, end: date) -> str:
     return "N/A"
 
 
+@lru_cache(maxsize=2048)
 def format_hkd(amount: float, is_price: bool = False) -> str:
     if amount is None:
         return "N/A"
     if is_price:
         return f"HK${amount:,.2f}"
-    if amount >= 1_000_000_000:
-        return f"HK${amount / 1_000_000_000:.2f}B"
-    if amount >= 1_000_000:
-        return f"HK${amount / 1_000_000:.2f}M"
+    for threshold, suffix in _AMOUNT_SCALES:
+        if amount >= threshold:
+            return f"HK${amount / threshold:.2f}{suffix}"
     return f"HK${amount:,.0f}"
 
 
+@lru_cache(maxsize=2048)
 def format_shares(amount: float) -> str:
     if amount >= 1_000_000_000:
         return f"{amount / 1_000_000_000:.2f}B shares"
@@ -185,30 +253,113 @@ def format_currency_amount(value) -> str:
     return f"{currency} {formatted}"
 
 
+_TERM_SPECS = (
+    ("Industry", "item", "industry", None, None),
+    ("Funds raised (HKD)", "item", "funds_raised_hkd", format_hkd, None),
+    (
+        "IPO price (HKD)",
+        "item",
+        "subscription_price_hkd",
+        lambda value: format_hkd(value, is_price=True),
+        None,
+    ),
+    (
+        "IPO price (HKD)",
+        "item",
+        "offer_price_text",
+        None,
+        lambda item, details: not item.get("subscription_price_hkd"),
+    ),
+    (
+        "IPO price",
+        "details",
+        "offer_price",
+        format_currency_amount,
+        lambda item, details: not item.get("subscription_price_hkd")
+        and not item.get("offer_price_text"),
+    ),
+    ("Lot size", "item", "lot_size", None, None),
+    ("Entry fee (HKD)", "item", "entry_fee_text", None, None),
+    ("Application board", "item", "application_board", None, None),
+    ("Application status", "item", "application_status", None, None),
+    ("Shares issued", "details", "shares_issued", format_shares, None),
+    ("Market cap", "details", "market_cap", format_currency_amount, None),
+    ("Valuation multiple", "details", "valuation_multiple", None, None),
+)
+
+
+def build_terms_table(item: Dict, details: Dict | None = None) -> Dict:
+    details = details or {}
+    terms = {
+        "Stock code": item.get("stock_code") or "N/A",
+        item.get("bookbuilding_label", "Bookbuilding"): _format_range(
+            item.get("bookbuilding_start"), item.get("bookbuilding_end")
+        ),
+        item.get("trade_label", "Trade date"): format_date(item.get("trade_date")),
+    }
+    for label, source, field, formatter, condition in _TERM_SPECS:
+        value = (item if source == "item" else details).get(field)
+        if not value:
+            continue
+        if condition and not condition(item, details):
+            continue
+        terms[label] = formatter(value) if formatter else value
+    return terms
+
+
+def _request_details(request_key: str):
+    st.session_state[request_key] = True
+
+
+def prefetch_details(items: List[Dict]) -> List[Dict]:
+    if not items:
+        return []
+    ctx = get_script_run_ctx()
+    with st.spinner("Loading filing details..."):
+        with ThreadPoolExecutor(
+            max_workers=min(DETAILS_MAX_WORKERS, len(items)),
+            initializer=add_script_run_ctx,
+            initargs=(None, ctx),
+        ) as executor:
+            return list(executor.map(load_details, [details_key(item) for item in items]))
+
+
+@st.fragment
 def render_details(selected_date: date, events: List[Dict], enable_filings: bool):
     if not events:
         st.info("No IPO events on this date.")
         return
 
+    request_keys = [f"details-{selected_date.isoformat()}-{idx}" for idx in range(len(events))]
+    requested = [
+        idx
+        for idx, request_key in enumerate(request_keys)
+        if enable_filings and (idx == 0 or st.session_state.get(request_key, False))
+    ]
+    loaded = prefetch_details([events[idx]["item"] for idx in requested])
+    details_by_index = dict(zip(requested, loaded))
+
     st.subheader(f"IPO events for {format_date(selected_date)}")
-    for event in events:
+    for idx, event in enumerate(events):
         item = event["item"]
         company = item.get("company", "Unknown")
+        company_page_url = item.get("company_page_url")
+        funds_raised_hkd = item.get("funds_raised_hkd")
+        show_details = idx in details_by_index
+        details = details_by_index.get(idx, {})
+        ipo_value = details.get("ipo_value_usd")
+        raise_amount = details.get("raise_amount_usd")
+        market_cap = details.get("market_cap_usd") or ipo_value
+        valuation_multiple = details.get("valuation_multiple")
+        request_key = request_keys[idx]
         header = f"{company} - {event['label']}"
-        with st.expander(header, expanded=True):
-            details = load_details(item) if enable_filings else {}
-            terms = build_terms_table(item, details if enable_filings else None)
+        with st.expander(header, expanded=idx == 0):
+            terms = build_terms_table(item, details if show_details else None)
             st.table(terms)
-            if item.get("company_page_url"):
-                st.markdown(f"Company page: {item['company_page_url']}")
-            ipo_value = details.get("ipo_value_usd") if enable_filings else None
-            raise_amount = details.get("raise_amount_usd") if enable_filings else None
-            if raise_amount is None:
-                funds_raised_hkd = item.get("funds_raised_hkd")
-                if funds_raised_hkd:
-                    raise_amount = convert_to_usd(funds_raised_hkd, "HKD")
-            market_cap = details.get("market_cap_usd") or ipo_value
-            valuation_multiple = details.get("valuation_multiple") if enable_filings else None
+            if company_page_url:
+                st.markdown(f"Company page: {company_page_url}")
+            if raise_amount is None and funds_raised_hkd:
+                raise_amount = _convert_to_usd(funds_raised_hkd, "HKD")
 
             col1, col2, col3 = st.columns(3)
             col1.metric("Market cap (USD)", format_money(market_cap))
@@ -219,6 +370,15 @@ def render_details(selected_date: date, events: List[Dict], enable_filings: bool
                 st.caption("Enable filings fetch to load term sheet details.")
                 continue
 
+            if not show_details:
+                st.button(
+                    "Load filings and term sheet",
+                    key=f"{request_key}-button",
+                    on_click=_request_details,
+                    args=(request_key,),
+                )
+                continue
+
             term_sheet_url = details.get("term_sheet_url") or item.get("prospectus_url")
             if term_sheet_url:
                 st.markdown(f"Term sheet: {term_sheet_url}")
@@ -245,19 +405,27 @@ def render_details(selected_date: date, events: List[Dict], enable_filings: bool
 
 
 st.set_page_config(page_title="Hong Kong IPO Calendar", layout="wide")
+st.markdown(CALENDAR_CSS_MIN, unsafe_allow_html=True)
 
 st.title("Hong Kong IPO Calendar")
 
+query_date = _selected_date_from_query()
+if query_date:
+    st.session_state["selected_date"] = query_date
+
 with st.sidebar:
     st.header("Controls")
-    use_live = st.toggle("Use live HKEX calendar", value=True)
-    enable_filings = st.toggle("Fetch filings and term sheet", value=True)
+    use_live = st.toggle("Use live HKEX calendar", value=_query_flag("live"))
+    enable_filings = st.toggle("Fetch filings and term sheet", value=_query_flag("filings"))
     today = date.today()
-    year = st.number_input("Year", min_value=2000, max_value=2100, value=today.year)
-    month = st.selectbox("Month", list(range(1, 13)), index=today.month - 1)
+    initial = query_date or today
+    year = st.number_input("Year", min_value=2000, max_value=2100, value=initial.year)
+    month = st.selectbox("Month", list(range(1, 13)), index=initial.month - 1)
     if st.button("Refresh data"):
         load_calendar.clear()
+        load_event_index.clear()
         load_details.clear()
+        clear_caches()
 
 items, meta = load_calendar(use_live)
 
@@ -267,22 +435,23 @@ if meta.get("source") == "sample":
 if meta.get("errors"):
     st.caption("; ".join(meta["errors"]))
 
-st.markdown(
-    "<span class='legend bookbuilding'>Prospectus/Bookbuilding</span>"
-    "<span class='legend application'>Application proof</span>"
-    "<span class='legend trade'>Listing/Trade</span>",
-    unsafe_allow_html=True,
-)
+st.markdown(LEGEND_HTML, unsafe_allow_html=True)
 
-all_events = build_event_index(items)
+all_events = load_event_index(use_live)
 
 selected_date = st.session_state.get("selected_date", today)
-render_calendar(year, month, all_events)
+render_calendar(
+    year, month, all_events, selected_date, _toggle_query(use_live, enable_filings)
+)
 
 selected_events = all_events.get(selected_date, [])
 render_details(selected_date, selected_events, enable_filings)
 
-application_only = [item for item in items if not item.get("trade_date")]
+application_only = sorted(
+    (item for item in items if not item.get("trade_date")),
+    key=lambda entry: (entry.get("bookbuilding_start") or date.min, entry.get("company", "")),
+    reverse=True,
+)
 if application_only:
     st.subheader("No listing date yet")
     rows = [
@@ -295,10 +464,9 @@ if application_only:
             "Board": item.get("application_board") or "N/A",
             "Status": item.get("application_status") or "N/A",
         }
-        for item in sorted(
-            application_only,
-            key=lambda entry: (entry.get("bookbuilding_start") or date.min, entry.get("company", "")),
-            reverse=True,
-        )
+        for item in application_only
     ]
-    st.dataframe(rows, use_container_width=True, height=320)
+    table = pd.DataFrame(rows, columns=NO_LISTING_DATE_COLUMNS)
+    for column in ("Category", "Board", "Status"):
+        table[column] = table[column].astype("category")
+    st.dataframe(table, use_container_width=True, height=320)
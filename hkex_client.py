@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from heapq import merge, nsmallest
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 import calendar
+import codecs
+import hashlib
 import json
 import os
 import re
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 
@@ -25,9 +34,51 @@ try:
 except ModuleNotFoundError:
     PdfReader = None
 
+try:
+    import fitz
+except ModuleNotFoundError:
+    fitz = None
+
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    _json_loads = json.loads
+
+try:
+    import ahocorasick
+except ModuleNotFoundError:
+    ahocorasick = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ModuleNotFoundError:
+    HTMLParser = None
+
+try:
+    import requests_cache
+except ModuleNotFoundError:
+    requests_cache = None
+
+try:
+    import h2  # noqa: F401
+    import httpx
+except ModuleNotFoundError:
+    httpx = None
+
+try:
+    import lxml  # noqa: F401
+
+    _BS_PARSER = "lxml"
+except ModuleNotFoundError:
+    _BS_PARSER = "html.parser"
+
 DATA_DIR = Path(__file__).resolve().parent / "data"
 SAMPLE_CALENDAR_PATH = DATA_DIR / "sample_ipo_calendar.json"
 OVERRIDES_PATH = DATA_DIR / "overrides.json"
+HTTP_CACHE_PATH = DATA_DIR / "http_cache"
+HTTP_CACHE_ENABLED = os.getenv("HKEX_CACHE_ENABLED", "").strip().lower() in {"1", "true", "yes"}
+HTTP_CACHE_EXPIRE_AFTER = timedelta(hours=6)
+HTTP_CACHE_URL_EXPIRE_AFTER = {"*.xlsx": timedelta(days=1)}
 
 HKEX_IPO_CALENDAR_URLS = [
     os.getenv("HKEX_IPO_CALENDAR_URL", "").strip(),
@@ -51,8 +102,30 @@ HKEX_SEARCH_ENDPOINTS = [
 ]
 
 DEFAULT_FX_USDHKD = 7.80
+_USD_PER_HKD = 1.0 / DEFAULT_FX_USDHKD
+_CURRENCY_ALIASES = {"": "USD", "us$": "USD", "usd": "USD", "hk$": "HKD", "hkd": "HKD"}
+_MONEY_SCALES = ((1_000_000_000, "B"), (1_000_000, "M"))
+_UNIT_MULTIPLIERS = {
+    "b": 1_000_000_000.0,
+    "bn": 1_000_000_000.0,
+    "billion": 1_000_000_000.0,
+    "m": 1_000_000.0,
+    "mn": 1_000_000.0,
+    "million": 1_000_000.0,
+}
 DEFAULT_TIMEOUT = 25
+CONNECT_TIMEOUT = 5
+HTTP_TIMEOUT = (CONNECT_TIMEOUT, DEFAULT_TIMEOUT)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
 MAX_PDF_BYTES = 60_000_000
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+PDF_RANGE_BYTES = 4 * 1024 * 1024
+PDF_TEXT_CACHE_SIZE = 256
+SEARCH_CACHE_SIZE = 512
+PDF_TERMS_CACHE_SIZE = 256
+LISTING_REPORT_HEADER_SCAN_ROWS = 20
+MAX_REPORT_BYTES = 20_000_000
 LONG_PDF_PAGE_THRESHOLD = 80
 SUMMARY_PDF_PAGE_LIMIT = 4
 DEFAULT_PDF_PAGE_LIMIT = 10
@@ -70,34 +143,159 @@ TERM_SHEET_KEYWORDS = [
 ]
 TERM_SHEET_MAX_PDFS = 3
 LISTING_DATE_LOOKUP_LIMIT = 20
+PDF_LOOKUP_WORKERS = 8
+AASTOCKS_DETAIL_WORKERS = 8
+LISTING_REPORT_WORKERS = 4
+FILING_LINK_EXTENSIONS = (".pdf", ".htm", ".html")
+MAX_BOOKBUILDING_SPAN_DAYS = 60
+SUMMARY_FIND_MAX_KEYWORDS = 2
+
+_DATE_FORMATS = ("%d %b %Y", "%d %B %Y", "%Y/%m/%d", "%d/%m/%Y")
+_FILING_TITLE_KEYS = ("title", "docTitle", "headline", "documentTitle")
+_FILING_URL_KEYS = ("url", "docUrl", "fileLink", "documentUrl")
+_FILING_DATE_KEYS = ("publishedDate", "date", "publishDate")
+_JSON_CONTAINERS = (dict, list)
+_APPLICATION_STATUS_LABELS = {"A": "Active", "I": "Inactive", "L": "Listed", "R": "Returned"}
+_FILING_LINK_SELECTOR = ", ".join(f"a[href$='{ext}' i]" for ext in FILING_LINK_EXTENSIONS)
+_MONTH_NAME = (
+    r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?"
+    r"|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
+)
+_RE_COMPACT_RANGE = re.compile(
+    rf"(\d{{1,2}})\s*-\s*(\d{{1,2}})\s+({_MONTH_NAME})\s+(\d{{4}})", re.I
+)
+_RE_DATE_TOKEN = re.compile(rf"\d{{1,2}}\s+{_MONTH_NAME}\s+\d{{4}}", re.I)
+_RE_ALNUM = re.compile(r"[^a-z0-9]+")
+_RE_WS = re.compile(r"\s+")
+_RE_YEAR4 = re.compile(r"(\d{4})")
+_RE_SCRIPT_BODY = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.S | re.I)
+_RE_INITIAL_STATE = re.compile(r"__INITIAL_STATE__\s*=\s*(\{.*\});", re.S)
+_RE_JSON_TOKEN = re.compile(r'["\\\[\]{}]')
+_RE_YMD = re.compile(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})")
+_RE_YMD_TOKEN = re.compile(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}")
+_RE_HK_STOCK_CODE = re.compile(r"(\d{4,5})\.HK")
+_RE_OFFER_PERIOD_CELL = re.compile(r"Offer Period</td>\s*<td[^>]*>(.*?)</td>", re.S)
+_RE_HTML_TAG = re.compile(r"<.*?>")
+_RE_LISTING_DATES = tuple(
+    re.compile(pattern, re.I)
+    for pattern in (
+        rf"(?:Listing Date|Expected Listing Date)[^\d]{{0,40}}([0-3]?\d\s+{_MONTH_NAME}\s+20\d{{2}})",
+        r"(?:Listing Date|Expected Listing Date)[^\d]{0,40}(\d{1,2}/\d{1,2}/20\d{2})",
+        r"(?:Listing Date|Expected Listing Date)[^\d]{0,40}(\d{4}-\d{1,2}-\d{1,2})",
+        rf"Dealings in the Shares are expected to commence on[^\d]{{0,40}}([0-3]?\d\s+{_MONTH_NAME}\s+20\d{{2}})",
+    )
+)
+_RE_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_RE_OFFER_PRICE = re.compile(
+    r"\boffer price(?: range)?[^\d]{0,40}(hk\$|us\$|usd|hkd)?\s*([0-9][0-9,]*(?:\.[0-9]+)?)"
+)
+_RE_GROSS_PROCEEDS = re.compile(
+    r"\bgross proceeds\b[^\d]{0,40}(hk\$|us\$|usd|hkd)?\s*([0-9][0-9,]*(?:\.[0-9]+)?)"
+    r"\s*(million|billion|mn|bn)?"
+)
+_RE_MARKET_CAP = re.compile(
+    r"\bmarket capitali[sz]ation\b[^\d]{0,60}(hk\$|us\$|usd|hkd)?\s*([0-9][0-9,]*(?:\.[0-9]+)?)"
+    r"\s*(million|billion|mn|bn)?"
+)
+_RE_PRICE_TERM_START = re.compile(
+    r"(?=(?P<offer_price>offer price)|(?P<gross_proceeds>gross proceeds)"
+    r"|(?P<market_cap>market capitali[sz]ation)|(?P<valuation_multiple>p/e|price[- ]to[- ]earnings))"
+)
+_RE_SHARE_COUNTS = (
+    re.compile(
+        r"(?:shares in issue(?: immediately (?:following|after)[^\\.]{0,60}?)?)"
+        r"[^\d]{0,40}([0-9,.]+)\s*(million|billion|mn|bn)?\s+shares"
+    ),
+    re.compile(
+        r"(?:number of offer shares|offer shares|shares offered)"
+        r"[^\d]{0,40}([0-9,.]+)\s*(million|billion|mn|bn)?\s+shares"
+    ),
+)
+_RE_VALUATION_MULTIPLE = re.compile(
+    r"\b(p/e|price[- ]to[- ]earnings)[^\d]{0,30}([0-9]+(?:\.[0-9]+)?)\s*(x|times)?"
+)
+_PRICE_TERM_PATTERNS = {
+    "offer_price": _RE_OFFER_PRICE,
+    "gross_proceeds": _RE_GROSS_PROCEEDS,
+    "market_cap": _RE_MARKET_CAP,
+    "valuation_multiple": _RE_VALUATION_MULTIPLE,
+}
+
+_PDF_TEXT_CACHE: Dict[Tuple[bytes, Optional[int], Any], str] = {}
+_PDF_TEXT_LOCK = threading.Lock()
+_SEARCH_CACHE: Dict[Tuple[str, date], Tuple[Filing, ...]] = {}
+_SEARCH_LOCK = threading.Lock()
+_PDF_TERMS_CACHE: Dict[str, Dict[str, Any]] = {}
+_PDF_TERMS_LOCK = threading.Lock()
 
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
 
 
 @dataclass
 class Filing:
+    __slots__ = ("title", "url", "published_date", "source")
+
     title: str
     url: str
     published_date: Optional[date]
     source: str
 
 
+@lru_cache(maxsize=1)
 def _session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": USER_AGENT,
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
+    if HTTP_CACHE_ENABLED and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name=str(HTTP_CACHE_PATH),
+            backend="sqlite",
+            expire_after=HTTP_CACHE_EXPIRE_AFTER,
+            urls_expire_after={**HTTP_CACHE_URL_EXPIRE_AFTER, "*.pdf": requests_cache.DO_NOT_CACHE},
+            stale_if_error=True,
+            allowable_methods=("GET", "POST"),
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(HTTP_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
     )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     return session
 
 
+@lru_cache(maxsize=1)
+def _download_client() -> Optional[Any]:
+    if httpx is None or HTTP_CACHE_ENABLED:
+        return None
+    limits = httpx.Limits(
+        max_keepalive_connections=HTTP_POOL_MAXSIZE, max_connections=HTTP_POOL_MAXSIZE * 2
+    )
+    return httpx.Client(
+        headers=HTTP_HEADERS,
+        timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT),
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(http2=True, limits=limits, retries=2),
+    )
+
+
 def safe_parse_date(value: Any) -> Optional[date]:
     if value is None:
         return None
@@ -108,6 +306,20 @@ def safe_parse_date(value: Any) -> Optional[date]:
     text = str(value).strip()
     if not text:
         return None
+    return _parse_date_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> Optional[date]:
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
     try:
         return date_parser.parse(text, dayfirst=True).date()
     except (ValueError, TypeError):
@@ -120,7 +332,12 @@ def parse_ymd_date(value: Any) -> Optional[date]:
     text = str(value).strip()
     if not text:
         return None
-    match = re.search(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})", text)
+    return _parse_ymd_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd_text(text: str) -> Optional[date]:
+    match = _RE_YMD.search(text)
     if match:
         year, month, day = (int(part) for part in match.groups())
         try:
@@ -131,7 +348,7 @@ def parse_ymd_date(value: Any) -> Optional[date]:
 
 
 def _parse_compact_range(text: str) -> Optional[Tuple[date, date]]:
-    match = re.search(r"(\d{1,2})\s*-\s*(\d{1,2})\s+([A-Za-z]{3,9})\s+(\d{4})", text)
+    match = _RE_COMPACT_RANGE.search(text)
     if not match:
         return None
     start_day, end_day, month, year = match.groups()
@@ -148,8 +365,8 @@ def extract_date_range(text: str) -> Tuple[Optional[date], Optional[date]]:
     compact = _parse_compact_range(text)
     if compact:
         return compact
-    matches = re.findall(r"\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}", text)
-    dates = [safe_parse_date(m) for m in matches if safe_parse_date(m)]
+    matches = _RE_DATE_TOKEN.findall(text)
+    dates = [parsed for parsed in map(safe_parse_date, matches) if parsed]
     if len(dates) >= 2:
         return dates[0], dates[1]
     if len(dates) == 1:
@@ -160,43 +377,78 @@ def extract_date_range(text: str) -> Tuple[Optional[date], Optional[date]]:
 def extract_first_date(text: str) -> Optional[date]:
     if not text:
         return None
-    match = re.search(r"\d{1,2}\s+[A-Za-z]{3,9}\s+\d{4}", text)
+    match = _RE_DATE_TOKEN.search(text)
     if match:
         return safe_parse_date(match.group(0))
     return safe_parse_date(text)
 
 
 def load_sample_calendar() -> List[Dict[str, Any]]:
-    if not SAMPLE_CALENDAR_PATH.exists():
+    raw = _load_json_file(SAMPLE_CALENDAR_PATH)
+    if raw is None:
         return []
-    with SAMPLE_CALENDAR_PATH.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
     items = [normalize_calendar_item(item) for item in raw]
     return _shift_sample_to_recent(items)
 
 
 def load_overrides() -> Dict[str, Dict[str, Any]]:
-    if not OVERRIDES_PATH.exists():
+    try:
+        mtime_ns = OVERRIDES_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
-    with OVERRIDES_PATH.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return data if isinstance(data, dict) else {}
+    return _load_overrides_version(mtime_ns)
+
+
+@lru_cache(maxsize=1)
+def _load_overrides_version(mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    data = _json_loads(OVERRIDES_PATH.read_bytes())
+    if not isinstance(data, dict):
+        return {}
+    return {_override_key(key): value for key, value in data.items()}
+
 
+def _override_key(key: str) -> str:
+    if key.strip().isdigit():
+        return normalize_stock_code(key)
+    return normalize_company_key(key)
+
+
+def _load_json_file(path: Path) -> Optional[Any]:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_json_file_version(path, mtime_ns)
 
+
+@lru_cache(maxsize=8)
+def _load_json_file_version(path: Path, mtime_ns: int) -> Any:
+    return _json_loads(path.read_bytes())
+
+
+@lru_cache(maxsize=2048)
 def normalize_company_key(name: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (name or "").lower())
+    return _RE_ALNUM.sub("", (name or "").lower())
 
 
 def normalize_stock_code(value: Any) -> str:
     if value is None:
         return ""
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return f"{value:05d}"
     if isinstance(value, float) and value != value:
         return ""
-    text = str(value).strip()
+    return _normalize_stock_code_text(str(value).strip())
+
+
+@lru_cache(maxsize=2048)
+def _normalize_stock_code_text(text: str) -> str:
     if not text or text in {"\"", "-"}:
         return ""
-    text = text.replace(".HK", "").replace("HK", "")
-    text = text.strip()
+    if text.isdigit():
+        return text if len(text) == 5 and text.isascii() else f"{int(text):05d}"
+    if "HK" in text:
+        text = text.replace(".HK", "").replace("HK", "").strip()
     if text.isdigit():
         return f"{int(text):05d}"
     return text
@@ -259,21 +511,28 @@ def fetch_ipo_calendar(use_live: bool = True) -> Tuple[List[Dict[str, Any]], Dic
     errors: List[str] = []
     if use_live:
         items: List[Dict[str, Any]] = []
-        try:
-            items.extend(_fetch_new_listing_report_calendar())
-        except Exception as exc:  # noqa: BLE001
-            errors.append(f"HKEX new listing report fetch failed: {exc}")
-        try:
-            items.extend(_fetch_aastocks_upcoming_calendar())
-        except Exception as exc:  # noqa: BLE001
-            errors.append(f"AASTOCKS upcoming IPO fetch failed: {exc}")
-        try:
-            items.extend(_fetch_application_proof_items())
-        except Exception as exc:  # noqa: BLE001
-            errors.append(f"HKEX application proof fetch failed: {exc}")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            main_page = executor.submit(_fetch_new_listing_main_page)
+            sources = [
+                (
+                    "HKEX new listing report",
+                    lambda: _fetch_new_listing_report_calendar(main_page.result()),
+                ),
+                ("AASTOCKS upcoming IPO", _fetch_aastocks_upcoming_calendar),
+                ("HKEX application proof", _fetch_application_proof_items),
+            ]
+            documents_future = executor.submit(
+                lambda: _fetch_new_listing_documents(main_page.result())
+            )
+            futures = [(label, executor.submit(fetch)) for label, fetch in sources]
+            for label, future in futures:
+                try:
+                    items.extend(future.result())
+                except Exception as exc:  # noqa: BLE001
+                    errors.append(f"{label} fetch failed: {exc}")
         if items:
             try:
-                documents = _fetch_new_listing_documents()
+                documents = documents_future.result()
                 _attach_new_listing_documents(items, documents)
                 items.extend(_build_listing_items_from_documents(documents, items))
                 _fill_missing_trade_dates(items)
@@ -296,7 +555,7 @@ def _fetch_ipo_calendar_hkex() -> List[Dict[str, Any]]:
     session = _session()
     last_error: Optional[str] = None
     for url in HKEX_IPO_CALENDAR_URLS:
-        response = session.get(url, timeout=DEFAULT_TIMEOUT)
+        response = session.get(url, timeout=HTTP_TIMEOUT)
         if response.status_code == 404:
             last_error = f"HKEX IPO calendar endpoint not found (404): {url}"
             continue
@@ -310,70 +569,71 @@ def _fetch_ipo_calendar_hkex() -> List[Dict[str, Any]]:
     raise RuntimeError("HKEX IPO calendar endpoint list is empty.")
 
 
-def _fetch_new_listing_report_calendar() -> List[Dict[str, Any]]:
+def _fetch_new_listing_report_calendar(html: Optional[str] = None) -> List[Dict[str, Any]]:
     if pd is None:
         raise RuntimeError("pandas/openpyxl not available for HKEX listing report")
-    session = _session()
-    response = session.get(HKEX_NEW_LISTING_MAIN_URL, timeout=DEFAULT_TIMEOUT)
-    response.raise_for_status()
-    html = response.text
+    if html is None:
+        html = _fetch_new_listing_main_page()
 
     report_links = _extract_listing_report_links(html)
     items: List[Dict[str, Any]] = []
-
-    for link in report_links:
-        items.extend(_parse_listing_report(link))
+    if report_links:
+        with ThreadPoolExecutor(max_workers=min(LISTING_REPORT_WORKERS, len(report_links))) as executor:
+            for report_items in executor.map(_parse_listing_report, report_links):
+                items.extend(report_items)
 
     items = [normalize_calendar_item(item) for item in items]
     return items
 
 
 def _fetch_application_proof_items() -> List[Dict[str, Any]]:
-    session = _session()
     items: List[Dict[str, Any]] = []
-    for board, url in HKEX_APPLICATION_JSON_URLS:
-        response = session.get(url, timeout=DEFAULT_TIMEOUT)
-        response.raise_for_status()
-        payload = response.json()
-        for record in payload.get("app", []):
-            posting_date = safe_parse_date(record.get("d") or record.get("postingDate"))
-            applicant = str(record.get("a") or "").strip()
-            if not applicant or not posting_date:
-                continue
-            status = _application_status_label(record.get("s"))
-            documents = _parse_application_documents(record)
-            items.append(
-                {
-                    "company": applicant,
-                    "stock_code": "",
-                    "industry": "",
-                    "application_status": status,
-                    "application_board": board,
-                    "application_proof_date": posting_date,
-                    "application_documents": documents,
-                    "bookbuilding_start": posting_date,
-                    "bookbuilding_end": posting_date,
-                    "bookbuilding_label": "Application proof",
-                    "bookbuilding_type": "application",
-                    "trade_date": None,
-                    "trade_label": "Listing date",
-                    "company_page_url": HKEX_APPLICATION_PROOF_URL,
-                    "source": "application-proof",
-                }
-            )
+    with ThreadPoolExecutor(max_workers=len(HKEX_APPLICATION_JSON_URLS)) as executor:
+        for board_items in executor.map(
+            lambda entry: _fetch_application_proof_board(*entry), HKEX_APPLICATION_JSON_URLS
+        ):
+            items.extend(board_items)
+    return items
+
+
+def _fetch_application_proof_board(board: str, url: str) -> List[Dict[str, Any]]:
+    response = _session().get(url, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    payload = _json_loads(response.content.removeprefix(codecs.BOM_UTF8))
+    items: List[Dict[str, Any]] = []
+    for record in payload.get("app", []):
+        posting_date = safe_parse_date(record.get("d") or record.get("postingDate"))
+        applicant = str(record.get("a") or "").strip()
+        if not applicant or not posting_date:
+            continue
+        status = _application_status_label(record.get("s"))
+        documents = _parse_application_documents(record)
+        items.append(
+            {
+                "company": applicant,
+                "stock_code": "",
+                "industry": "",
+                "application_status": status,
+                "application_board": board,
+                "application_proof_date": posting_date,
+                "application_documents": documents,
+                "bookbuilding_start": posting_date,
+                "bookbuilding_end": posting_date,
+                "bookbuilding_label": "Application proof",
+                "bookbuilding_type": "application",
+                "trade_date": None,
+                "trade_label": "Listing date",
+                "company_page_url": HKEX_APPLICATION_PROOF_URL,
+                "source": "application-proof",
+            }
+        )
     return items
 
 
 def _application_status_label(value: Optional[str]) -> str:
-    mapping = {
-        "A": "Active",
-        "I": "Inactive",
-        "L": "Listed",
-        "R": "Returned",
-    }
     if not value:
         return "Unknown"
-    return mapping.get(str(value).strip().upper(), str(value))
+    return _APPLICATION_STATUS_LABELS.get(str(value).strip().upper(), str(value))
 
 
 def _parse_application_documents(record: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -425,13 +685,13 @@ def _normalize_app_url(path: str) -> str:
 
 def _fetch_aastocks_upcoming_calendar() -> List[Dict[str, Any]]:
     session = _session()
-    response = session.get(AASTOCKS_UPCOMING_IPO_URL, timeout=DEFAULT_TIMEOUT)
+    response = session.get(AASTOCKS_UPCOMING_IPO_URL, timeout=HTTP_TIMEOUT)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.text, _BS_PARSER)
     table = _find_aastocks_upcoming_table(soup)
     if table is None:
         return []
-    items: List[Dict[str, Any]] = []
+    rows: List[Tuple[List[Any], str, Optional[str], str]] = []
     for row in table.find_all("tr"):
         cells = row.find_all("td")
         if len(cells) < 7:
@@ -445,13 +705,24 @@ def _fetch_aastocks_upcoming_calendar() -> List[Dict[str, Any]]:
             continue
         if stock_code and stock_code.lower() == "stock":
             continue
+        rows.append((cells, company, summary_url, stock_code))
+    if not rows:
+        return []
+    with ThreadPoolExecutor(max_workers=min(AASTOCKS_DETAIL_WORKERS, len(rows))) as executor:
+        offer_periods = list(
+            executor.map(
+                lambda url: _fetch_aastocks_offer_period(session, url),
+                [summary_url for _, _, summary_url, _ in rows],
+            )
+        )
+    items: List[Dict[str, Any]] = []
+    for (cells, company, summary_url, stock_code), offer_period_text in zip(rows, offer_periods):
         industry = _clean_text(cells[1].get_text(" ", strip=True))
         offer_price_text = _clean_text(cells[2].get_text(" ", strip=True))
         lot_size = _clean_text(cells[3].get_text(" ", strip=True))
         entry_fee_text = _clean_text(cells[4].get_text(" ", strip=True))
         closing_date = parse_ymd_date(cells[5].get_text(" ", strip=True))
         listing_date = parse_ymd_date(cells[6].get_text(" ", strip=True))
-        offer_period_text = _fetch_aastocks_offer_period(session, summary_url) if summary_url else None
         book_start, book_end = _parse_aastocks_offer_period(offer_period_text, closing_date)
         book_label = "Offer period" if offer_period_text else "Offer close"
         item = {
@@ -494,20 +765,20 @@ def _find_aastocks_upcoming_table(soup: BeautifulSoup) -> Optional[BeautifulSoup
 def _fetch_aastocks_offer_period(session: requests.Session, url: Optional[str]) -> Optional[str]:
     if not url:
         return None
-    response = session.get(url, timeout=DEFAULT_TIMEOUT)
+    response = session.get(url, timeout=HTTP_TIMEOUT)
     if not response.ok:
         return None
-    match = re.search(r"Offer Period</td>\s*<td[^>]*>(.*?)</td>", response.text, re.S)
+    match = _RE_OFFER_PERIOD_CELL.search(response.text)
     if not match:
         return None
-    return _clean_text(re.sub(r"<.*?>", " ", match.group(1)))
+    return _clean_text(_RE_HTML_TAG.sub(" ", match.group(1)))
 
 
 def _parse_aastocks_offer_period(
     offer_period_text: Optional[str], closing_date: Optional[date]
 ) -> Tuple[Optional[date], Optional[date]]:
     if offer_period_text:
-        matches = re.findall(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}", offer_period_text)
+        matches = _RE_YMD_TOKEN.findall(offer_period_text)
         if len(matches) >= 2:
             start = parse_ymd_date(matches[0])
             end = parse_ymd_date(matches[1])
@@ -527,7 +798,7 @@ def _extract_stock_code(cell: BeautifulSoup) -> str:
     if span:
         return span.get_text(strip=True)
     text = cell.get_text(" ", strip=True)
-    match = re.search(r"(\d{4,5})\.HK", text)
+    match = _RE_HK_STOCK_CODE.search(text)
     if match:
         return match.group(1)
     return ""
@@ -537,11 +808,16 @@ def _clean_text(value: str) -> str:
     return " ".join(value.split())
 
 
-def _fetch_new_listing_documents() -> Dict[str, Dict[str, Any]]:
-    session = _session()
-    response = session.get(HKEX_NEW_LISTING_MAIN_URL, timeout=DEFAULT_TIMEOUT)
+def _fetch_new_listing_documents(html: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    if html is None:
+        html = _fetch_new_listing_main_page()
+    return _extract_new_listing_documents(html)
+
+
+def _fetch_new_listing_main_page() -> str:
+    response = _session().get(HKEX_NEW_LISTING_MAIN_URL, timeout=HTTP_TIMEOUT)
     response.raise_for_status()
-    return _extract_new_listing_documents(response.text)
+    return response.text
 
 
 def _attach_new_listing_documents(
@@ -607,12 +883,12 @@ def _build_listing_items_from_documents(
 
 
 def _fill_missing_trade_dates(items: Iterable[Dict[str, Any]]) -> None:
-    if PdfReader is None:
+    if PdfReader is None and fitz is None:
         return
-    lookups = 0
     cutoff = date.today() - timedelta(days=365)
+    pending: List[Dict[str, Any]] = []
     for item in items:
-        if lookups >= LISTING_DATE_LOOKUP_LIMIT:
+        if len(pending) >= LISTING_DATE_LOOKUP_LIMIT:
             break
         if item.get("trade_date"):
             continue
@@ -621,42 +897,40 @@ def _fill_missing_trade_dates(items: Iterable[Dict[str, Any]]) -> None:
         reference_date = item.get("bookbuilding_start") or item.get("prospectus_date")
         if reference_date and reference_date < cutoff:
             continue
-        for url in (item.get("prospectus_url"), item.get("announcement_url")):
-            if not url or not url.lower().endswith(".pdf"):
-                continue
-            listing_date = extract_listing_date_from_pdf(url)
-            if listing_date:
-                item["trade_date"] = listing_date
-                item.setdefault("trade_label", "Listing date")
-                break
-        lookups += 1
+        pending.append(item)
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=min(PDF_LOOKUP_WORKERS, len(pending))) as executor:
+        listing_dates = list(executor.map(_lookup_listing_date, pending))
+    for item, listing_date in zip(pending, listing_dates):
+        if listing_date:
+            item["trade_date"] = listing_date
+            item.setdefault("trade_label", "Listing date")
+
+
+def _lookup_listing_date(item: Dict[str, Any]) -> Optional[date]:
+    for url in (item.get("prospectus_url"), item.get("announcement_url")):
+        if not url or not url.lower().endswith(".pdf"):
+            continue
+        listing_date = extract_listing_date_from_pdf(url)
+        if listing_date:
+            return listing_date
+    return None
 
 
 def extract_listing_date_from_pdf(url: str) -> Optional[date]:
-    if PdfReader is None:
-        return None
-    try:
-        data = _download_pdf(url)
-    except Exception:  # noqa: BLE001
+    if PdfReader is None and fitz is None:
         return None
-    if not data:
-        return None
-    text = _extract_text_from_pdf(data)
+    text = _download_pdf_text(url)
     if not text:
         return None
-    text = re.sub(r"\s+", " ", text)
+    text = _RE_WS.sub(" ", text)
     return _extract_listing_date_from_text(text)
 
 
 def _extract_listing_date_from_text(text: str) -> Optional[date]:
-    patterns = [
-        r"(?:Listing Date|Expected Listing Date)[^\d]{0,40}([0-3]?\d\s+[A-Za-z]{3,9}\s+20\d{2})",
-        r"(?:Listing Date|Expected Listing Date)[^\d]{0,40}(\d{1,2}/\d{1,2}/20\d{2})",
-        r"(?:Listing Date|Expected Listing Date)[^\d]{0,40}(\d{4}-\d{1,2}-\d{1,2})",
-        r"Dealings in the Shares are expected to commence on[^\d]{0,40}([0-3]?\d\s+[A-Za-z]{3,9}\s+20\d{2})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.I)
+    for pattern in _RE_LISTING_DATES:
+        match = pattern.search(text)
         if match:
             parsed = safe_parse_date(match.group(1))
             if parsed:
@@ -683,7 +957,7 @@ def _dedupe_calendar_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 def _extract_listing_report_links(html: str) -> List[str]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _BS_PARSER)
     links: List[str] = []
     for anchor in soup.find_all("a", href=True):
         href = anchor["href"]
@@ -694,14 +968,16 @@ def _extract_listing_report_links(html: str) -> List[str]:
         links.append(urljoin(HKEX_NEWS_BASE, href))
 
     def sort_key(url: str) -> int:
-        match = re.search(r"(\d{4})", url)
+        match = _RE_YEAR4.search(url)
         return int(match.group(1)) if match else 0
 
     return sorted(set(links), key=sort_key, reverse=True)
 
 
 def _extract_new_listing_documents(html: str) -> Dict[str, Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    if HTMLParser is not None:
+        return _extract_new_listing_documents_selectolax(html)
+    soup = BeautifulSoup(html, _BS_PARSER)
     listing_table = None
     for table in soup.find_all("table"):
         headers = [th.get_text(strip=True) for th in table.find_all("th")]
@@ -731,8 +1007,44 @@ def _extract_new_listing_documents(html: str) -> Dict[str, Dict[str, Any]]:
     return documents
 
 
+def _extract_new_listing_documents_selectolax(html: str) -> Dict[str, Dict[str, Any]]:
+    tree = HTMLParser(html)
+    listing_table = None
+    for table in tree.css("table"):
+        headers = [th.text(strip=True) for th in table.css("th")]
+        if headers and "Stock Code" in headers and "Stock Name" in headers:
+            listing_table = table
+            break
+    if listing_table is None:
+        return {}
+    documents: Dict[str, Dict[str, Any]] = {}
+    for row in listing_table.css("tr"):
+        cells = row.css("td")
+        if len(cells) < 5:
+            continue
+        stock_code = normalize_stock_code(cells[0].text(strip=True))
+        if not stock_code:
+            continue
+        documents[stock_code] = {
+            "company": cells[1].text(separator=" ", strip=True),
+            "announcement_url": _first_node_link(cells[2]),
+            "prospectus_url": _first_node_link(cells[3]),
+            "allotment_url": _first_node_link(cells[4]),
+        }
+    return documents
+
+
+def _first_node_link(cell: Any) -> Optional[str]:
+    anchor = cell.css_first("a[href]")
+    if anchor is None:
+        return None
+    return urljoin(HKEX_NEWS_BASE, anchor.attributes.get("href") or "")
+
+
 def _first_link(cell: BeautifulSoup) -> Optional[str]:
-    anchor = cell.find("a", href=True)
+    anchor = cell.a
+    if anchor is not None and not anchor.has_attr("href"):
+        anchor = cell.find("a", href=True)
     if not anchor:
         return None
     return urljoin(HKEX_NEWS_BASE, anchor["href"])
@@ -742,25 +1054,35 @@ def _parse_listing_report(url: str) -> List[Dict[str, Any]]:
     if pd is None:
         return []
     try:
-        raw = pd.read_excel(url, header=None)
+        data = _download_bytes(url, MAX_REPORT_BYTES)
+        if not data:
+            return []
+        raw = pd.read_excel(BytesIO(data), header=None, engine="openpyxl")
     except Exception:  # noqa: BLE001
         return []
     header_row = _find_listing_report_header(raw)
     if header_row is None:
         return []
     rows = raw.iloc[header_row + 1 :]
+    rows = rows[rows[0].notna()]
+    columns = zip(
+        rows[1].tolist(),
+        rows[2].tolist(),
+        rows[3].tolist(),
+        rows[4].tolist(),
+        rows[8].tolist(),
+        rows[9].tolist(),
+    )
     items: List[Dict[str, Any]] = []
-    for _, row in rows.iterrows():
-        if pd.isna(row[0]):
-            continue
-        stock_code = normalize_stock_code(row[1])
+    for raw_code, raw_company, raw_prospectus, raw_listing, raw_funds, raw_price in columns:
+        stock_code = normalize_stock_code(raw_code)
         if not stock_code:
             continue
-        company = str(row[2]).replace("\n", " ").strip()
-        prospectus_date = safe_parse_date(row[3])
-        listing_date = safe_parse_date(row[4])
-        funds_raised_hkd = _parse_float(row[8])
-        subscription_price_hkd = _parse_float(row[9])
+        company = str(raw_company).replace("\n", " ").strip()
+        prospectus_date = safe_parse_date(raw_prospectus)
+        listing_date = safe_parse_date(raw_listing)
+        funds_raised_hkd = _parse_float(raw_funds)
+        subscription_price_hkd = _parse_float(raw_price)
         item = {
             "company": company,
             "stock_code": stock_code,
@@ -781,13 +1103,13 @@ def _parse_listing_report(url: str) -> List[Dict[str, Any]]:
 
 
 def _find_listing_report_header(raw: Any) -> Optional[int]:
-    for idx, row in raw.iterrows():
-        values = [str(value) for value in row.tolist() if value is not None]
-        if any("Stock Code" in value for value in values) and any(
-            "Company Name" in value for value in values
-        ):
-            return idx
-    return None
+    head = raw.head(LISTING_REPORT_HEADER_SCAN_ROWS).astype(str)
+    has_code = head.apply(lambda col: col.str.contains("Stock Code", regex=False)).any(axis=1)
+    has_company = head.apply(lambda col: col.str.contains("Company Name", regex=False)).any(axis=1)
+    matches = has_code & has_company
+    if not matches.any():
+        return None
+    return matches.idxmax()
 
 
 def _parse_float(value: Any) -> Optional[float]:
@@ -807,12 +1129,11 @@ def _parse_float(value: Any) -> Optional[float]:
 
 
 def _extract_calendar_from_html(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
-
-    json_items = _extract_calendar_from_scripts(soup)
+    json_items = _extract_calendar_from_scripts(html)
     if json_items:
         return [normalize_calendar_item(item) for item in json_items]
 
+    soup = BeautifulSoup(html, _BS_PARSER)
     tables = soup.find_all("table")
     if not tables:
         return []
@@ -882,25 +1203,24 @@ def _extract_calendar_from_html(html: str) -> List[Dict[str, Any]]:
     return items
 
 
-def _extract_calendar_from_scripts(soup: BeautifulSoup) -> List[Dict[str, Any]]:
-    for script in soup.find_all("script"):
-        if not script.string:
-            continue
-        text = script.string
-        if "ipo" not in text.lower() or "calendar" not in text.lower():
+def _extract_calendar_from_scripts(html: str) -> List[Dict[str, Any]]:
+    for script in _RE_SCRIPT_BODY.finditer(html):
+        text = script.group(1)
+        lowered = text.lower()
+        if "ipo" not in lowered or "calendar" not in lowered:
             continue
-        state_match = re.search(r"__INITIAL_STATE__\s*=\s*(\{.*\});", text, re.S)
+        state_match = _RE_INITIAL_STATE.search(text)
         if state_match:
             try:
-                payload = json.loads(state_match.group(1))
+                payload = _json_loads(state_match.group(1))
                 items = _find_calendar_items_in_state(payload)
                 if items:
                     return items
             except json.JSONDecodeError:
                 pass
-        for match in re.finditer(r"\[\{.*?\}\]", text, re.S):
+        for snippet in _iter_json_array_candidates(text):
             try:
-                candidate = json.loads(match.group(0))
+                candidate = _json_loads(snippet)
             except json.JSONDecodeError:
                 continue
             if isinstance(candidate, list) and candidate and isinstance(candidate[0], dict):
@@ -909,26 +1229,55 @@ def _extract_calendar_from_scripts(soup: BeautifulSoup) -> List[Dict[str, Any]]:
     return []
 
 
+def _iter_json_array_candidates(text: str) -> Iterable[str]:
+    start = text.find("[{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped_at = -1
+        end = None
+        for token in _RE_JSON_TOKEN.finditer(text, start):
+            if token.start() == escaped_at:
+                continue
+            char = token.group(0)
+            if in_string:
+                if char == "\\":
+                    escaped_at = token.end()
+                elif char == '"':
+                    in_string = False
+                continue
+            if char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+                if depth == 0:
+                    end = token.end()
+                    break
+        if end is None:
+            return
+        yield text[start:end]
+        start = text.find("[{", end)
+
+
 def _find_calendar_items_in_state(payload: Any) -> List[Dict[str, Any]]:
-    if isinstance(payload, dict):
-        for key, value in payload.items():
-            if isinstance(value, list) and value and isinstance(value[0], dict):
-                keys = {k.lower() for k in value[0].keys()}
+    stack = deque([(payload, False)])
+    while stack:
+        node, is_dict_value = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((value, True) for value in reversed(list(node.values())))
+        elif isinstance(node, list):
+            if is_dict_value and node and isinstance(node[0], dict):
+                keys = {k.lower() for k in node[0].keys()}
                 if {"company", "listingdate"} & keys:
-                    return value
-            nested = _find_calendar_items_in_state(value)
-            if nested:
-                return nested
-    elif isinstance(payload, list):
-        for item in payload:
-            nested = _find_calendar_items_in_state(item)
-            if nested:
-                return nested
+                    return node
+            stack.extend((value, False) for value in reversed(node))
     return []
 
 
 def build_event_index(items: Iterable[Dict[str, Any]]) -> Dict[date, List[Dict[str, Any]]]:
-    events: Dict[date, List[Dict[str, Any]]] = {}
+    events: DefaultDict[date, List[Dict[str, Any]]] = defaultdict(list)
     for item in items:
         book_start = item.get("bookbuilding_start")
         book_end = item.get("bookbuilding_end")
@@ -938,21 +1287,14 @@ def build_event_index(items: Iterable[Dict[str, Any]]) -> Dict[date, List[Dict[s
         trade_label = item.get("trade_label", "Trade")
 
         if book_start and book_end:
-            current = book_start
-            while current <= book_end:
-                events.setdefault(current, []).append(
-                    {
-                        "type": book_type,
-                        "label": book_label,
-                        "item": item,
-                    }
-                )
-                current += timedelta(days=1)
+            span_days = (book_end - book_start).days + 1
+            if 0 < span_days <= MAX_BOOKBUILDING_SPAN_DAYS:
+                payload = {"type": book_type, "label": book_label, "item": item}
+                for offset in range(span_days):
+                    events[book_start + timedelta(days=offset)].append(payload)
         if trade_date:
-            events.setdefault(trade_date, []).append(
-                {"type": "trade", "label": trade_label, "item": item}
-            )
-    return events
+            events[trade_date].append({"type": "trade", "label": trade_label, "item": item})
+    return dict(events)
 
 
 def fetch_ipo_details(item: Dict[str, Any]) -> Dict[str, Any]:
@@ -961,7 +1303,7 @@ def fetch_ipo_details(item: Dict[str, Any]) -> Dict[str, Any]:
     stock_code = normalize_stock_code(item.get("stock_code"))
     for key in (normalize_company_key(company), stock_code):
         if key and key in overrides:
-            return overrides[key]
+            return dict(overrides[key])
 
     filings: List[Filing] = []
     prospectus_date = item.get("prospectus_date")
@@ -1048,7 +1390,7 @@ def fetch_ipo_details(item: Dict[str, Any]) -> Dict[str, Any]:
 
     return {
         "term_sheet_url": term_sheet.url if term_sheet else None,
-        "filings": [filing.__dict__ for filing in filings[:6]],
+        "filings": [_filing_to_dict(filing) for filing in filings[:6]],
         "ipo_value_usd": ipo_value_usd,
         "raise_amount_usd": raise_amount_usd,
         "valuation_multiple": extracted_terms.get("valuation_multiple"),
@@ -1062,33 +1404,69 @@ def fetch_ipo_details(item: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def search_hkex_filings(company_name: str) -> List[Filing]:
+    company_name = (company_name or "").strip()
     if not company_name:
         return []
+    key = (company_name, date.today())
+    with _SEARCH_LOCK:
+        cached = _SEARCH_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+    filings = _search_hkex_filings(*key)
+    if filings:
+        with _SEARCH_LOCK:
+            if len(_SEARCH_CACHE) >= SEARCH_CACHE_SIZE:
+                del _SEARCH_CACHE[next(iter(_SEARCH_CACHE))]
+            _SEARCH_CACHE[key] = tuple(filings)
+    return filings
+
+
+def clear_caches() -> None:
+    with _SEARCH_LOCK:
+        _SEARCH_CACHE.clear()
+    with _PDF_TERMS_LOCK:
+        _PDF_TERMS_CACHE.clear()
+
+
+def _search_hkex_filings(company_name: str, search_date: date) -> List[Filing]:
     session = _session()
-    params = _build_search_params(company_name)
-    for source, url, method in HKEX_SEARCH_ENDPOINTS:
-        try:
-            if method == "post":
-                response = session.post(url, data=params, timeout=DEFAULT_TIMEOUT)
-            else:
-                response = session.get(url, params=params, timeout=DEFAULT_TIMEOUT)
-            if not response.ok:
-                continue
-            json_payload = _try_parse_json(response.text)
-            if json_payload:
-                filings = _extract_filings_from_json(json_payload, source)
-                if filings:
-                    return filings
-            filings = _extract_filings_from_html(response.text, source)
+    params = _build_search_params(company_name, search_date)
+    executor = ThreadPoolExecutor(max_workers=len(HKEX_SEARCH_ENDPOINTS))
+    try:
+        futures = [
+            executor.submit(_search_hkex_endpoint, session, source, url, method, params)
+            for source, url, method in HKEX_SEARCH_ENDPOINTS
+        ]
+        for future in futures:
+            filings = future.result()
             if filings:
                 return filings
-        except Exception:  # noqa: BLE001
-            continue
-    return []
+        return []
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
-def _build_search_params(company_name: str) -> Dict[str, str]:
-    today = date.today()
+def _search_hkex_endpoint(
+    session: requests.Session, source: str, url: str, method: str, params: Dict[str, str]
+) -> List[Filing]:
+    try:
+        if method == "post":
+            response = session.post(url, data=params, timeout=HTTP_TIMEOUT)
+        else:
+            response = session.get(url, params=params, timeout=HTTP_TIMEOUT)
+        if not response.ok:
+            return []
+        json_payload = _try_parse_json(response.content)
+        if json_payload:
+            filings = _extract_filings_from_json(json_payload, source)
+            if filings:
+                return filings
+        return _extract_filings_from_html(response.text, source)
+    except Exception:  # noqa: BLE001
+        return []
+
+
+def _build_search_params(company_name: str, today: date) -> Dict[str, str]:
     start = today - timedelta(days=365 * 2)
     return {
         "lang": "EN",
@@ -1103,19 +1481,17 @@ def _build_search_params(company_name: str) -> Dict[str, str]:
     }
 
 
-def _try_parse_json(text: str) -> Optional[Any]:
-    text = text.strip()
-    if not text:
-        return None
-    if not (text.startswith("{") or text.startswith("[")):
+def _try_parse_json(content: bytes) -> Optional[Any]:
+    content = content.strip().removeprefix(codecs.BOM_UTF8)
+    if not content.startswith((b"{", b"[")):
         return None
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _json_loads(content)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return None
 
 
-def _pick_first(node: Dict[str, Any], keys: List[str]) -> Optional[str]:
+def _pick_first(node: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
     for key in keys:
         value = node.get(key)
         if value:
@@ -1126,14 +1502,14 @@ def _pick_first(node: Dict[str, Any], keys: List[str]) -> Optional[str]:
 
 def _extract_filings_from_json(payload: Any, source: str) -> List[Filing]:
     filings: List[Filing] = []
-    stack = [payload]
+    stack = deque([payload])
     while stack:
         node = stack.pop()
         if isinstance(node, dict):
-            title = _pick_first(node, ["title", "docTitle", "headline", "documentTitle"])
-            url = _pick_first(node, ["url", "docUrl", "fileLink", "documentUrl"])
-            published = _pick_first(node, ["publishedDate", "date", "publishDate"])
-            if title and url:
+            title = _pick_first(node, _FILING_TITLE_KEYS)
+            url = _pick_first(node, _FILING_URL_KEYS) if title else None
+            if url:
+                published = _pick_first(node, _FILING_DATE_KEYS)
                 filings.append(
                     Filing(
                         title=title,
@@ -1142,23 +1518,25 @@ def _extract_filings_from_json(payload: Any, source: str) -> List[Filing]:
                         source=source,
                     )
                 )
-            for value in node.values():
-                stack.append(value)
+            stack.extend(value for value in node.values() if isinstance(value, _JSON_CONTAINERS))
         elif isinstance(node, list):
-            stack.extend(node)
+            stack.extend(value for value in node if isinstance(value, _JSON_CONTAINERS))
     return _dedupe_filings(filings)
 
 
 def _extract_filings_from_html(html: str, source: str) -> List[Filing]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _BS_PARSER)
     filings: List[Filing] = []
-    for link in soup.find_all("a", href=True):
+    parents: Dict[int, Tuple[str, Optional[date]]] = {}
+    for link in soup.select(_FILING_LINK_SELECTOR):
         href = link["href"]
-        if not _is_filing_link(href):
-            continue
         title = " ".join(link.stripped_strings)
-        parent_text = " ".join(link.parent.stripped_strings)
-        published_date = extract_first_date(parent_text)
+        parent = link.parent
+        cached = parents.get(id(parent))
+        if cached is None:
+            parent_text = " ".join(parent.stripped_strings)
+            cached = parents[id(parent)] = (parent_text, extract_first_date(parent_text))
+        parent_text, published_date = cached
         filings.append(
             Filing(
                 title=title or parent_text,
@@ -1170,31 +1548,34 @@ def _extract_filings_from_html(html: str, source: str) -> List[Filing]:
     return _dedupe_filings(filings)
 
 
-def _is_filing_link(href: str) -> bool:
-    href_lower = href.lower()
-    return any(href_lower.endswith(ext) for ext in (".pdf", ".htm", ".html"))
-
-
 def _normalize_hkex_url(url: str) -> str:
     if url.startswith("http"):
         return url
-    if url.startswith("/"):
-        return f"{HKEX_NEWS_HOST}{url}"
-    return f"{HKEX_NEWS_HOST}/{url}"
+    return f"{HKEX_NEWS_HOST}{url}" if url[:1] == "/" else f"{HKEX_NEWS_HOST}/{url}"
+
+
+def _filing_to_dict(filing: Filing) -> Dict[str, Any]:
+    return {
+        "title": filing.title,
+        "url": filing.url,
+        "published_date": filing.published_date,
+        "source": filing.source,
+    }
 
 
 def _dedupe_filings(filings: List[Filing]) -> List[Filing]:
-    seen = set()
-    unique: List[Filing] = []
+    by_url: Dict[str, Filing] = {}
     for filing in filings:
-        if filing.url in seen:
-            continue
-        seen.add(filing.url)
-        unique.append(filing)
-    unique.sort(key=lambda item: item.published_date or date.min, reverse=True)
+        by_url.setdefault(filing.url, filing)
+    unique = list(by_url.values())
+    unique.sort(key=_filing_sort_key, reverse=True)
     return unique
 
 
+def _filing_sort_key(filing: Filing) -> date:
+    return filing.published_date or date.min
+
+
 def select_term_sheet(filings: List[Filing]) -> Optional[Filing]:
     if not filings:
         return None
@@ -1215,26 +1596,31 @@ def _term_sheet_rank(filing: Filing) -> Tuple[int, int, int]:
 def extract_terms_from_filings(filings: List[Filing]) -> Dict[str, Any]:
     if not filings:
         return {}
-    extracted: Dict[str, Any] = {}
-    checked = set()
-    for filing in sorted(filings, key=_term_sheet_rank):
-        if len(checked) >= TERM_SHEET_MAX_PDFS:
-            break
+    ranks: Dict[str, Tuple[int, int, int]] = {}
+    for filing in filings:
         url = filing.url
         if not url or not url.lower().endswith(".pdf"):
             continue
-        if url in checked:
-            continue
-        checked.add(url)
-        terms = extract_terms_from_pdf(url)
-        if not terms:
-            continue
-        for key, value in terms.items():
-            if value is None:
+        rank = _term_sheet_rank(filing)
+        if url not in ranks or rank < ranks[url]:
+            ranks[url] = rank
+    urls = nsmallest(TERM_SHEET_MAX_PDFS, ranks, key=ranks.__getitem__)
+    if not urls:
+        return {}
+    extracted: Dict[str, Any] = {}
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    try:
+        for terms in executor.map(extract_terms_from_pdf, urls):
+            if not terms:
                 continue
-            extracted.setdefault(key, value)
-        if _has_enough_term_fields(extracted):
-            break
+            for key, value in terms.items():
+                if value is None:
+                    continue
+                extracted.setdefault(key, value)
+            if _has_enough_term_fields(extracted):
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return extracted
 
 
@@ -1250,24 +1636,33 @@ def _has_enough_term_fields(terms: Dict[str, Any]) -> bool:
 
 
 def extract_terms_from_pdf(url: str) -> Dict[str, Any]:
-    if PdfReader is None:
-        return {}
-    try:
-        data = _download_pdf(url)
-    except Exception:  # noqa: BLE001
-        return {}
-    if not data:
+    if PdfReader is None and fitz is None:
         return {}
-    text = _extract_text_from_pdf(data)
+    with _PDF_TERMS_LOCK:
+        terms = _PDF_TERMS_CACHE.get(url)
+    if terms is not None:
+        return dict(terms)
+    text = _download_pdf_text(url, stop_when=_has_all_price_terms)
     if not text:
         return {}
-    text = re.sub(r"\s+", " ", text)
+    terms = _extract_terms_from_text(text)
+    if any(terms.values()):
+        with _PDF_TERMS_LOCK:
+            if len(_PDF_TERMS_CACHE) >= PDF_TERMS_CACHE_SIZE:
+                del _PDF_TERMS_CACHE[next(iter(_PDF_TERMS_CACHE))]
+            _PDF_TERMS_CACHE[url] = terms
+    return dict(terms)
 
-    offer_price = _extract_offer_price(text)
-    gross_proceeds = _extract_gross_proceeds(text)
-    market_cap = _extract_market_cap(text)
-    valuation_multiple = _extract_valuation_multiple(text)
-    shares_issued = _extract_share_count(text)
+
+def _extract_terms_from_text(text: str) -> Dict[str, Any]:
+    text = _RE_WS.sub(" ", text)
+    lowered = text.lower()
+    terms = _extract_price_terms(lowered)
+    offer_price = terms["offer_price"]
+    gross_proceeds = terms["gross_proceeds"]
+    market_cap = terms["market_cap"]
+    valuation_multiple = terms["valuation_multiple"]
+    shares_issued = _extract_share_count(lowered)
     if offer_price and shares_issued:
         market_cap = (offer_price[0] * shares_issued, offer_price[1])
 
@@ -1275,6 +1670,7 @@ def extract_terms_from_pdf(url: str) -> Dict[str, Any]:
         text,
         keywords=["our business", "business model", "principal activities", "we are", "we provide"],
         max_sentences=2,
+        lowered=lowered,
     )
     financial_trend = extract_summary(
         text,
@@ -1287,6 +1683,7 @@ def extract_terms_from_pdf(url: str) -> Dict[str, Any]:
             "operating results",
         ],
         max_sentences=2,
+        lowered=lowered,
     )
 
     ipo_value_usd = None
@@ -1310,45 +1707,147 @@ def extract_terms_from_pdf(url: str) -> Dict[str, Any]:
     }
 
 
+def _download_pdf_text(url: str, stop_when: Optional[Callable[[str], bool]] = None) -> str:
+    if fitz is not None:
+        try:
+            head = _download_bytes(url, MAX_PDF_BYTES, PDF_RANGE_BYTES)
+        except Exception:  # noqa: BLE001
+            return ""
+        text = _extract_text_from_pdf(head, stop_when=stop_when) if head else ""
+        if text.strip() or len(head) != PDF_RANGE_BYTES:
+            return text
+    try:
+        data = _download_pdf(url)
+    except Exception:  # noqa: BLE001
+        return ""
+    if not data:
+        return ""
+    return _extract_text_from_pdf(data, stop_when=stop_when)
+
+
 def _download_pdf(url: str) -> bytes:
+    return _download_bytes(url, MAX_PDF_BYTES)
+
+
+def _download_bytes(url: str, max_bytes: int, range_bytes: Optional[int] = None) -> bytes:
+    headers = {"Range": f"bytes=0-{range_bytes - 1}"} if range_bytes else None
+    client = _download_client()
+    if client is not None:
+        with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            return _read_capped(
+                response.headers, response.iter_bytes(DOWNLOAD_CHUNK_SIZE), max_bytes
+            )
     session = _session()
-    response = session.get(url, stream=True, timeout=DEFAULT_TIMEOUT)
-    response.raise_for_status()
-    content = bytearray()
-    for chunk in response.iter_content(chunk_size=64 * 1024):
-        if chunk:
-            content.extend(chunk)
-        if len(content) > MAX_PDF_BYTES:
+    with session.get(url, stream=True, timeout=HTTP_TIMEOUT, headers=headers) as response:
+        response.raise_for_status()
+        return _read_capped(
+            response.headers, response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE), max_bytes
+        )
+
+
+def _read_capped(headers: Any, body: Iterable[bytes], max_bytes: int) -> bytes:
+    content_length = headers.get("Content-Length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        return b""
+    chunks: List[bytes] = []
+    total = 0
+    for chunk in body:
+        if not chunk:
+            continue
+        chunks.append(chunk)
+        total += len(chunk)
+        if total > max_bytes:
             return b""
-    return bytes(content)
+    return b"".join(chunks)
+
+
+def _extract_text_from_pdf(
+    data: bytes,
+    max_pages: Optional[int] = None,
+    stop_when: Optional[Callable[[str], bool]] = None,
+) -> str:
+    key = (hashlib.blake2b(data, digest_size=16).digest(), max_pages, stop_when)
+    with _PDF_TEXT_LOCK:
+        text = _PDF_TEXT_CACHE.get(key)
+    if text is not None:
+        return text
+    text = _read_pdf_text(data, max_pages, stop_when)
+    with _PDF_TEXT_LOCK:
+        if len(_PDF_TEXT_CACHE) >= PDF_TEXT_CACHE_SIZE:
+            del _PDF_TEXT_CACHE[next(iter(_PDF_TEXT_CACHE))]
+        _PDF_TEXT_CACHE[key] = text
+    return text
 
 
-def _extract_text_from_pdf(data: bytes) -> str:
+def _read_pdf_text(
+    data: bytes,
+    max_pages: Optional[int],
+    stop_when: Optional[Callable[[str], bool]],
+) -> str:
+    texts: List[str] = []
+    for text in _iter_pdf_pages(data, max_pages):
+        texts.append(text)
+        if stop_when and stop_when(" ".join(texts)):
+            break
+    return " ".join(texts)
+
+
+def _iter_pdf_pages(data: bytes, max_pages: Optional[int] = None) -> Iterable[str]:
+    if fitz is not None:
+        try:
+            document = fitz.open(stream=data, filetype="pdf")
+        except Exception:  # noqa: BLE001
+            return
+        with document:
+            for index in range(_pdf_page_limit(document.page_count, max_pages)):
+                try:
+                    yield document.load_page(index).get_text("text") or ""
+                except Exception:  # noqa: BLE001
+                    continue
+        return
     if PdfReader is None:
-        return ""
+        return
     try:
         reader = PdfReader(BytesIO(data))
     except Exception:  # noqa: BLE001
-        return ""
-    page_limit = DEFAULT_PDF_PAGE_LIMIT
-    if len(reader.pages) > LONG_PDF_PAGE_THRESHOLD:
-        page_limit = SUMMARY_PDF_PAGE_LIMIT
-    texts: List[str] = []
-    for page in reader.pages[:page_limit]:
+        return
+    for page in reader.pages[: _pdf_page_limit(len(reader.pages), max_pages)]:
         try:
-            texts.append(page.extract_text() or "")
+            yield page.extract_text() or ""
         except Exception:  # noqa: BLE001
             continue
-    return " ".join(texts)
 
 
-def extract_summary(text: str, keywords: List[str], max_sentences: int = 2) -> Optional[str]:
-    lowered = text.lower()
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+def _pdf_page_limit(page_count: int, max_pages: Optional[int]) -> int:
+    page_limit = DEFAULT_PDF_PAGE_LIMIT
+    if page_count > LONG_PDF_PAGE_THRESHOLD:
+        page_limit = SUMMARY_PDF_PAGE_LIMIT
+    if max_pages is not None:
+        page_limit = min(page_limit, max_pages)
+    return min(page_count, page_limit)
+
+
+def _has_all_price_terms(text: str) -> bool:
+    return all(_extract_price_terms(_RE_WS.sub(" ", text).lower()).values())
+
+
+def extract_summary(
+    text: str, keywords: List[str], max_sentences: int = 2, lowered: Optional[str] = None
+) -> Optional[str]:
+    if lowered is None:
+        lowered = text.lower()
+    if keywords and all(keywords) and len(lowered) == len(text):
+        if ahocorasick is not None and len(keywords) > SUMMARY_FIND_MAX_KEYWORDS:
+            hits = _keyword_hits(lowered, tuple(keywords))
+        else:
+            hits = merge(*(_find_all(lowered, keyword) for keyword in keywords), key=_hit_end)
+        return _summary_from_hits(text, hits, max_sentences)
     selected: List[str] = []
-    for sentence in sentences:
+    for start, end in _iter_sentence_spans(text):
         if len(selected) >= max_sentences:
             break
+        sentence = text[start:end]
         sentence_lower = sentence.lower()
         if any(keyword in sentence_lower for keyword in keywords):
             selected.append(sentence.strip())
@@ -1360,40 +1859,92 @@ def extract_summary(text: str, keywords: List[str], max_sentences: int = 2) -> O
     return None
 
 
-def _extract_offer_price(text: str) -> Optional[Tuple[float, str]]:
-    pattern = r"offer price(?: range)?[^\d]*(HK\$|US\$|USD|HKD)?\s*([0-9.,]+)"
-    match = re.search(pattern, text, re.I)
-    if match:
-        return _parse_money(match.group(2), match.group(1))
-    return None
+@lru_cache(maxsize=32)
+def _keyword_automaton(keywords: Tuple[str, ...]) -> Any:
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
 
 
-def _extract_gross_proceeds(text: str) -> Optional[Tuple[float, str]]:
-    pattern = r"gross proceeds[^\d]*(HK\$|US\$|USD|HKD)?\s*([0-9.,]+)\s*(million|billion|mn|bn)?"
-    match = re.search(pattern, text, re.I)
-    if match:
-        return _parse_money(match.group(2), match.group(1), match.group(3))
+def _keyword_hits(lowered: str, keywords: Tuple[str, ...]) -> Iterable[Tuple[int, int]]:
+    for end, length in _keyword_automaton(keywords).iter(lowered):
+        yield end + 1 - length, end + 1
+
+
+def _find_all(lowered: str, keyword: str) -> Iterable[Tuple[int, int]]:
+    position = lowered.find(keyword)
+    while position != -1:
+        yield position, position + len(keyword)
+        position = lowered.find(keyword, position + 1)
+
+
+def _hit_end(hit: Tuple[int, int]) -> int:
+    return hit[1]
+
+
+def _summary_from_hits(
+    text: str, hits: Iterable[Tuple[int, int]], max_sentences: int
+) -> Optional[str]:
+    spans = _iter_sentence_spans(text)
+    current = next(spans)
+    upcoming = next(spans, None)
+    found = False
+    selected: List[Tuple[int, int]] = []
+    for start, end in hits:
+        found = True
+        if len(selected) >= max_sentences:
+            break
+        while upcoming is not None and upcoming[0] <= start:
+            current, upcoming = upcoming, next(spans, None)
+        if current[0] <= start and end <= current[1] and (not selected or selected[-1] != current):
+            selected.append(current)
+    if selected:
+        return " ".join(text[start:end].strip() for start, end in selected)
+    if found:
+        return text[:400].strip()
     return None
 
 
-def _extract_market_cap(text: str) -> Optional[Tuple[float, str]]:
-    pattern = r"market capitali[sz]ation[^\d]*(HK\$|US\$|USD|HKD)?\s*([0-9.,]+)\s*(million|billion|mn|bn)?"
-    match = re.search(pattern, text, re.I)
+def _iter_sentence_spans(text: str) -> Iterable[Tuple[int, int]]:
+    start = 0
+    for separator in _RE_SENTENCE_SPLIT.finditer(text):
+        yield start, separator.start()
+        start = separator.end()
+    yield start, len(text)
+
+
+def _extract_price_terms(text: str) -> Dict[str, Any]:
+    matches: Dict[str, Any] = {}
+    for start in _RE_PRICE_TERM_START.finditer(text):
+        field = start.lastgroup
+        if field in matches:
+            continue
+        match = _PRICE_TERM_PATTERNS[field].match(text, start.start())
+        if not match:
+            continue
+        matches[field] = match
+        if len(matches) == len(_PRICE_TERM_PATTERNS):
+            break
+    terms: Dict[str, Any] = dict.fromkeys(_PRICE_TERM_PATTERNS)
+    match = matches.get("offer_price")
     if match:
-        return _parse_money(match.group(2), match.group(1), match.group(3))
-    return None
+        terms["offer_price"] = _parse_money(match.group(2), match.group(1))
+    for field in ("gross_proceeds", "market_cap"):
+        match = matches.get(field)
+        if match:
+            terms[field] = _parse_money(match.group(2), match.group(1), match.group(3))
+    match = matches.get("valuation_multiple")
+    if match:
+        terms["valuation_multiple"] = f"{match.group(2)}x"
+    return terms
 
 
 def _extract_share_count(text: str) -> Optional[float]:
-    patterns = [
-        r"(?:Shares in issue(?: immediately (?:following|after)[^\\.]{0,60}?)?)"
-        r"[^\d]{0,40}([0-9,.]+)\s*(million|billion|mn|bn)?\s+Shares",
-        r"(?:Number of Offer Shares|Offer Shares|Shares offered)"
-        r"[^\d]{0,40}([0-9,.]+)\s*(million|billion|mn|bn)?\s+Shares",
-    ]
     counts: List[float] = []
-    for pattern in patterns:
-        for match in re.finditer(pattern, text, re.I):
+    for pattern in _RE_SHARE_COUNTS:
+        for match in pattern.finditer(text):
             count = _parse_share_count(match.group(1), match.group(2))
             if count:
                 counts.append(count)
@@ -1410,56 +1961,35 @@ def _parse_share_count(value: str, unit: Optional[str]) -> Optional[float]:
     return clean_value * _unit_multiplier(unit)
 
 
-def _extract_valuation_multiple(text: str) -> Optional[str]:
-    pattern = r"(P/E|price[- ]to[- ]earnings)[^\d]*([0-9]+(?:\.[0-9]+)?)\s*(x|times)?"
-    match = re.search(pattern, text, re.I)
-    if match:
-        return f"{match.group(2)}x"
-    return None
-
-
 def _parse_money(value: str, currency: Optional[str], unit: Optional[str] = None) -> Tuple[float, str]:
-    clean_value = float(value.replace(",", ""))
-    multiplier = _unit_multiplier(unit)
-    amount = clean_value * multiplier
-    return amount, normalize_currency(currency)
+    amount = float(value.replace(",", "")) * _UNIT_MULTIPLIERS.get((unit or "").lower(), 1.0)
+    return amount, _CURRENCY_ALIASES.get((currency or "").lower()) or normalize_currency(currency)
 
 
 def normalize_currency(currency: Optional[str]) -> str:
     if not currency:
         return "USD"
-    currency = currency.upper().replace(" ", "")
-    if currency in {"US$", "USD"}:
-        return "USD"
-    if currency in {"HK$", "HKD"}:
-        return "HKD"
-    return currency
+    currency = currency.lower().replace(" ", "")
+    return _CURRENCY_ALIASES.get(currency) or currency.upper()
 
 
 def _unit_multiplier(unit: Optional[str]) -> float:
     if not unit:
         return 1.0
-    unit = unit.lower()
-    if unit in {"b", "bn", "billion"}:
-        return 1_000_000_000.0
-    if unit in {"m", "mn", "million"}:
-        return 1_000_000.0
-    return 1.0
+    return _UNIT_MULTIPLIERS.get(unit.lower(), 1.0)
 
 
 def convert_to_usd(amount: float, currency: str) -> float:
-    if currency == "USD":
-        return amount
     if currency == "HKD":
-        return amount / DEFAULT_FX_USDHKD
+        return amount * _USD_PER_HKD
     return amount
 
 
+@lru_cache(maxsize=2048)
 def format_money(amount: Optional[float]) -> str:
     if amount is None:
         return "N/A"
-    if amount >= 1_000_000_000:
-        return f"${amount / 1_000_000_000:.2f}B"
-    if amount >= 1_000_000:
-        return f"${amount / 1_000_000:.2f}M"
+    for threshold, suffix in _MONEY_SCALES:
+        if amount >= threshold:
+            return f"${amount / threshold:.2f}{suffix}"
     return f"${amount:,.0f}"